@@ -10,18 +10,251 @@ import os
 import sys
 import shutil
 import argparse
+import contextlib
+import csv
 import json
+import re
 import subprocess
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Final, List, Mapping, Optional, Tuple
 import logging
+import mmap
 import urllib.parse
+import urllib.request
 import tempfile
+import time
+import types
+
+# Prefer orjson for parsing when available, it is considerably faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Stream metadata files with ijson when available, only keeping the fields we use
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Environment variables set by a running window manager, in priority order
+WM_ENV_SIGNALS = (
+    ('HYPRLAND_INSTANCE_SIGNATURE', 'hyprland'),
+    ('LABWC_SOCKET', 'labwc'),
+    ('SWAYSOCK', 'sway'),
+    ('I3SOCK', 'i3'),
+)
+# Window managers recognised in DESKTOP_SESSION / XDG_CURRENT_DESKTOP, in priority order
+WM_CANDIDATES = ('hyprland', 'labwc', 'sway', 'i3', 'openbox', 'fluxbox')
+# Single pass over XDG_CURRENT_DESKTOP for any of the candidates above
+_WM_RE = re.compile('|'.join(map(re.escape, WM_CANDIDATES)), re.IGNORECASE)
+# Process names used as a last resort for window manager / compositor detection
+WM_PROCESS_NAMES = ('hyprland', 'labwc', 'sway', 'i3')
+COMPOSITOR_PROCESS_NAMES = ('picom', 'compton', 'xcompmgr')
+
+# Settings for --update-compatibility / --update-auto-config-rules downloads
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Repositories with more widgets than this are scanned with a thread pool
+PARALLEL_SCAN_THRESHOLD = 256
+# Hosts whose URLs are known to end in <user>/<repo>[.git]
+_KNOWN_GIT_HOSTS = frozenset({'github.com', 'gitlab.com', 'bitbucket.org'})
+# Cached metadata clones unused for this long (in seconds) are removed
+CLONE_CACHE_TTL = 7 * 24 * 60 * 60
+# Repository metadata files, in the order they are tried (JSON first, it is the cheapest to parse)
+METADATA_FILES = (
+    'dotfile-info.json',
+    '.dotfile-info.json',
+    'dotfile-info.yaml',
+    'dotfile-info.yml',
+    'README.md'
+)
+# Repository metadata fields read from dotfile-info files
+_METADATA_FIELDS = frozenset({'description', 'tags', 'author', 'version', 'compatibility'})
+# README title/tag patterns used for metadata fallback; the title is only searched near the top
+README_HEADER_SCAN_BYTES = 2048
+_README_HEADER_RE = re.compile(rb'^# (.+)$', re.MULTILINE)
+# Tags are scanned on raw bytes; non-ASCII bytes are let through and each match is trimmed to
+# its leading str \w run after decoding, so UTF-8 tags match as they would on decoded text
+_README_TAG_RE = re.compile(rb'#([\w\x80-\xff]+)')
+_README_TAG_WORD_RE = re.compile(r'\w+')
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Default settings used when no external file is found, built once at import
+_DEFAULT_AUTO_CONFIG_RULES: Final[Mapping[str, Any]] = _freeze({
+    "include_programs": {
+        "terminals": ["alacritty", "kitty", "st", "urxvt", "xterm"],
+        "window_managers": ["dwm", "i3", "sway", "hyprland", "labwc"],
+        "bars_widgets": ["eww", "waybar", "polybar", "fabric", "weld"],
+        "compositors": ["picom", "compton", "xcompmgr"],
+        "editors": ["vim", "nvim", "emacs"],
+        "shells": ["zsh", "bash", "fish"],
+        "other": ["tmux", "git", "ssh"]
+    },
+    "exclude_directories": {
+        "system": ["systemd", "dconf", "kde.org", "KDE", "pulse", "gtk-3.0", "gtk-4.0"],
+        "browsers": ["chromium", "firefox", "chrome"],
+        "applications": ["rustdesk", "antimicrox", "opendeck", "nemo", "gtklock"]
+    },
+    "include_keywords": ["wm", "bar", "term", "editor", "shell", "compositor"],
+    "ignore_patterns": ["*.lock", "*.socket", "*.cookie", "*.pid", "*.tmp", "*.log", "*.cache"],
+    "confirmation_threshold": 10,
+    "max_configs_per_pull": 50
+})
+
+_DEFAULT_PROGRAM_COMPATIBILITY: Final[Mapping[str, Any]] = _freeze({
+    "single_config_only": {
+        "alacritty": {
+            "warning": "Alacritty can only load one configuration file. Multiple configs will overwrite each other.",
+            "suggestion": "Consider using different config names or environment-specific subdirectories."
+        },
+        "kitty": {
+            "warning": "Kitty can only load one configuration file. Multiple configs will overwrite each other.",
+            "suggestion": "Consider using different config names or environment-specific subdirectories."
+        }
+    },
+    "supports_multiple_configs": {
+        "eww": {
+            "info": "EWW supports multiple configuration files and can load them via command line arguments.",
+            "suggestion": "Use --config flag to specify different config files."
+        }
+    }
+})
+
+_DEFAULT_CONFIG: Final[Mapping[str, Any]] = _freeze({
+    "backup_existing": True,
+    "create_backup_dir": True,
+    "dry_run": False
+})
+
+
+@contextlib.contextmanager
+def _atomic_write(path: Path, mode: str = 'w'):
+    """Write to a temporary file next to path and atomically replace path on success"""
+    # Write through symlinks (e.g. stow-managed files) by replacing the link target
+    path = Path(os.path.realpath(path))
+    temp_file = tempfile.NamedTemporaryFile(mode=mode, dir=path.parent, prefix=f".{path.name}.",
+                                            suffix='.tmp', delete=False)
+    try:
+        with temp_file:
+            yield temp_file
+        # Keep the permissions of the file being replaced, or use the umask default like open()
+        if path.exists():
+            shutil.copymode(path, temp_file.name)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file.name, 0o666 & ~umask)
+        os.replace(temp_file.name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_file.name)
+        except OSError:
+            pass
+        raise
+
+
+def _download_file(url: str, destination: Path) -> bytes:
+    """Stream url to destination in chunks, replacing it atomically once complete
+
+    Returns the downloaded bytes so callers can parse them without re-reading the file.
+    """
+    chunks = []
+    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, \
+            _atomic_write(destination, 'wb') as f:
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def _copy_file(source: str, destination: Path) -> bytes:
+    """Copy a local file's contents to destination atomically, without its metadata
+
+    Returns the copied bytes so callers can parse them without re-reading the file.
+    """
+    with open(source, 'rb') as f:
+        data = f.read()
+    with _atomic_write(destination, 'wb') as f:
+        f.write(data)
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml():
+    """Import PyYAML once, returning None if it is not installed"""
+    try:
+        import yaml
+        return yaml
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(parent: Path) -> frozenset:
+    """List a directory once and cache the entry names"""
+    try:
+        return frozenset(os.listdir(parent))
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_repo_name(url: str) -> str:
+    """Extract repository name from URL, memoized since callers repeat URLs"""
+    try:
+        # SSH-style git@host:user/repo.git has no URL structure, just take the last path segment
+        if url.startswith('git@'):
+            path = url.rstrip('/')
+            if path.endswith('.git'):
+                path = path[:-4]
+            return path.rsplit('/', 1)[-1] or "unknown-repo"
+        
+        # Parse the URL
+        parsed = urllib.parse.urlparse(url)
+        
+        # Handle different URL formats
+        if parsed.netloc in _KNOWN_GIT_HOSTS:
+            # Extract path and remove .git suffix
+            path = parsed.path.strip('/')
+            if path.endswith('.git'):
+                path = path[:-4]
+            
+            # Split by '/' and take the last part (repo name)
+            repo_name = path.split('/')[-1]
+            return repo_name
+        
+        # For other URLs, try to extract from path
+        path = parsed.path.strip('/')
+        if path.endswith('.git'):
+            path = path[:-4]
+        
+        # Take the last part of the path
+        repo_name = path.split('/')[-1] if path else "unknown-repo"
+        return repo_name
+        
+    except Exception as e:
+        logger.warning(f"Could not extract repo name from URL {url}: {e}")
+        return "unknown-repo"
+
 
 class DotfileManager:
     """Main dotfile manager class"""
@@ -29,137 +262,130 @@ class DotfileManager:
     def __init__(self, repo_path: str, config_file: str = "dotfile_config.json"):
         self.repo_path = Path(repo_path).resolve()
         self.home_config = Path.home() / ".config"
+        self._proc_names = None
+        self._config_files_cache = {}
+        self._widget_names_cache = {}
+        self._backup_existing_names = None
+        self._repo_list_cache = None
         self.config_file = self.repo_path / config_file
         self.config = self._load_config()
         # Look for configuration files in priority order: script dir -> repo path -> ~/.config
         script_dir = Path(__file__).parent
-        self.repo_list_file = script_dir / "compatible_repos.txt"
-        if not self.repo_list_file.exists():
-            self.repo_list_file = self.repo_path / "compatible_repos.txt"
-        if not self.repo_list_file.exists():
-            self.repo_list_file = self.home_config / "compatible_repos.txt"
+        search_dirs = [script_dir, self.repo_path, self.home_config]
+        self.repo_list_file = self._find_first("compatible_repos.txt", search_dirs)
         
         self.git_repos_dir = self.repo_path / "git_repos"
         
-        self.program_compatibility_file = script_dir / "program_compatibility.json"
-        if not self.program_compatibility_file.exists():
-            self.program_compatibility_file = self.repo_path / "program_compatibility.json"
-        if not self.program_compatibility_file.exists():
-            self.program_compatibility_file = self.home_config / "program_compatibility.json"
-        self.program_compatibility = self._load_program_compatibility()
-        
-        # Load auto config rules
-        self.auto_config_rules_file = script_dir / "auto_config_rules.json"
-        if not self.auto_config_rules_file.exists():
-            self.auto_config_rules_file = self.repo_path / "auto_config_rules.json"
-        if not self.auto_config_rules_file.exists():
-            self.auto_config_rules_file = self.home_config / "auto_config_rules.json"
-        self.auto_config_rules = self._load_auto_config_rules()
-        
+        # Compatibility settings and auto config rules are parsed lazily on first access
+        self.program_compatibility_file = self._find_first("program_compatibility.json", search_dirs)
+        self.auto_config_rules_file = self._find_first("auto_config_rules.json", search_dirs)
+    
+    @functools.cached_property
+    def program_compatibility(self) -> Dict:
+        """Program compatibility settings, loaded on first access"""
+        return self._load_program_compatibility()
+    
+    @functools.cached_property
+    def auto_config_rules(self) -> Dict:
+        """Auto configuration filtering rules, loaded on first access"""
+        return self._load_auto_config_rules()
+    
+    @functools.cached_property
+    def _include_programs_set(self) -> set:
+        """Flattened set of program names from the include_programs rules"""
+        programs = set()
+        for category, names in self.auto_config_rules.get('include_programs', {}).items():
+            programs.update(names)
+        return programs
+    
+    @functools.cached_property
+    def _exclude_dirs_set(self) -> set:
+        """Flattened set of directory names from the exclude_directories rules"""
+        directories = set()
+        for category, names in self.auto_config_rules.get('exclude_directories', {}).items():
+            directories.update(names)
+        return directories
+    
+    @functools.cached_property
+    def _include_keywords_lower(self) -> Tuple[str, ...]:
+        """Lowercased include_keywords rules"""
+        return tuple(keyword.lower() for keyword in self.auto_config_rules.get('include_keywords', []))
+    
+    @functools.cached_property
+    def _ignore_patterns_fn(self):
+        """shutil.copytree ignore callable built from the ignore_patterns rules"""
+        ignore_patterns_list = self.auto_config_rules.get('ignore_patterns', [
+            '*.lock', '*.socket', '*.cookie', '*.pid', '*.tmp', '*.log', '*.cache'
+        ])
+        return shutil.ignore_patterns(*ignore_patterns_list)
+    
+    def _find_first(self, filename: str, search_dirs: List[Path]) -> Path:
+        """Return the first directory's copy of filename, falling back to the last directory"""
+        for directory in search_dirs:
+            if filename in _dir_entries(directory):
+                return directory / filename
+        return search_dirs[-1] / filename
+        
+    def _load_json(self, path: Path, default_factory, label: str, raw: Optional[bytes] = None) -> Dict:
+        """Parse a JSON file (or its already-read raw bytes), falling back to default_factory() on parse errors"""
+        try:
+            if raw is not None:
+                return _json_loads(raw)
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing {label}: {e}")
+            return default_factory()
+    
     def _load_config(self) -> Dict:
         """Load configuration from JSON file"""
         # Check primary config file location
         if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing config file: {e}")
-                return self._get_default_config()
+            return self._load_json(self.config_file, self._get_default_config, "config file")
         
         # Fallback to ~/.config
         fallback_config = self.home_config / self.config_file.name
         if fallback_config.exists():
-            try:
-                logger.info(f"Using config file from ~/.config: {fallback_config}")
-                with open(fallback_config, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing fallback config file: {e}")
-                return self._get_default_config()
+            logger.info(f"Using config file from ~/.config: {fallback_config}")
+            return self._load_json(fallback_config, self._get_default_config, "fallback config file")
         
         logger.info("No config file found, using defaults")
         return self._get_default_config()
     
-    def _load_program_compatibility(self) -> Dict:
+    def _load_program_compatibility(self, raw: Optional[bytes] = None) -> Dict:
         """Load program compatibility settings from external file"""
-        if self.program_compatibility_file.exists():
-            try:
-                logger.info(f"Loading program compatibility from: {self.program_compatibility_file}")
-                with open(self.program_compatibility_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing program compatibility file: {e}")
-                return self._get_default_program_compatibility()
+        if raw is not None or self.program_compatibility_file.exists():
+            logger.info(f"Loading program compatibility from: {self.program_compatibility_file}")
+            return self._load_json(self.program_compatibility_file,
+                                   self._get_default_program_compatibility,
+                                   "program compatibility file", raw)
         else:
             logger.info("No program compatibility file found, using defaults")
             return self._get_default_program_compatibility()
     
-    def _load_auto_config_rules(self) -> Dict:
+    def _load_auto_config_rules(self, raw: Optional[bytes] = None) -> Dict:
         """Load auto configuration filtering rules from external file"""
-        if self.auto_config_rules_file.exists():
-            try:
-                logger.info(f"Loading auto config rules from: {self.auto_config_rules_file}")
-                with open(self.auto_config_rules_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing auto config rules file: {e}")
-                return self._get_default_auto_config_rules()
+        if raw is not None or self.auto_config_rules_file.exists():
+            logger.info(f"Loading auto config rules from: {self.auto_config_rules_file}")
+            return self._load_json(self.auto_config_rules_file,
+                                   self._get_default_auto_config_rules,
+                                   "auto config rules file", raw)
         else:
             logger.info("No auto config rules file found, using defaults")
             return self._get_default_auto_config_rules()
     
-    def _get_default_auto_config_rules(self) -> Dict:
-        """Get default auto configuration filtering rules"""
-        return {
-            "include_programs": {
-                "terminals": ["alacritty", "kitty", "st", "urxvt", "xterm"],
-                "window_managers": ["dwm", "i3", "sway", "hyprland", "labwc"],
-                "bars_widgets": ["eww", "waybar", "polybar", "fabric", "weld"],
-                "compositors": ["picom", "compton", "xcompmgr"],
-                "editors": ["vim", "nvim", "emacs"],
-                "shells": ["zsh", "bash", "fish"],
-                "other": ["tmux", "git", "ssh"]
-            },
-            "exclude_directories": {
-                "system": ["systemd", "dconf", "kde.org", "KDE", "pulse", "gtk-3.0", "gtk-4.0"],
-                "browsers": ["chromium", "firefox", "chrome"],
-                "applications": ["rustdesk", "antimicrox", "opendeck", "nemo", "gtklock"]
-            },
-            "include_keywords": ["wm", "bar", "term", "editor", "shell", "compositor"],
-            "ignore_patterns": ["*.lock", "*.socket", "*.cookie", "*.pid", "*.tmp", "*.log", "*.cache"],
-            "confirmation_threshold": 10,
-            "max_configs_per_pull": 50
-        }
+    def _get_default_auto_config_rules(self) -> Mapping[str, Any]:
+        """Get default auto configuration filtering rules (read-only)"""
+        return _DEFAULT_AUTO_CONFIG_RULES
     
-    def _get_default_program_compatibility(self) -> Dict:
-        """Get default program compatibility settings"""
-        return {
-            "single_config_only": {
-                "alacritty": {
-                    "warning": "Alacritty can only load one configuration file. Multiple configs will overwrite each other.",
-                    "suggestion": "Consider using different config names or environment-specific subdirectories."
-                },
-                "kitty": {
-                    "warning": "Kitty can only load one configuration file. Multiple configs will overwrite each other.",
-                    "suggestion": "Consider using different config names or environment-specific subdirectories."
-                }
-            },
-            "supports_multiple_configs": {
-                "eww": {
-                    "info": "EWW supports multiple configuration files and can load them via command line arguments.",
-                    "suggestion": "Use --config flag to specify different config files."
-                }
-            }
-        }
+    def _get_default_program_compatibility(self) -> Mapping[str, Any]:
+        """Get default program compatibility settings (read-only)"""
+        return _DEFAULT_PROGRAM_COMPATIBILITY
     
     def _get_default_config(self) -> Dict:
         """Get default configuration"""
-        return {
-            "backup_existing": True,
-            "create_backup_dir": True,
-            "dry_run": False
-        }
+        # Callers (e.g. CLI overrides) mutate the config, so hand out a copy
+        return dict(_DEFAULT_CONFIG)
     
     def detect_environment(self) -> Dict[str, str]:
         """Detect current system environment"""
@@ -190,56 +416,28 @@ class DotfileManager:
     
     def _detect_window_manager(self) -> Optional[str]:
         """Detect current window manager"""
-        # Check for Hyprland
-        if os.environ.get('HYPRLAND_INSTANCE_SIGNATURE'):
-            return 'hyprland'
+        env = os.environ
         
-        # Check for LabWC
-        if os.environ.get('LABWC_SOCKET'):
-            return 'labwc'
-            
-        # Check for Sway
-        if os.environ.get('SWAYSOCK'):
-            return 'sway'
-            
-        # Check for i3
-        if os.environ.get('I3SOCK'):
-            return 'i3'
+        # Check for WM-specific sockets/signatures (Hyprland, LabWC, Sway, i3)
+        for var, wm in WM_ENV_SIGNALS:
+            if env.get(var):
+                return wm
         
         # Check DESKTOP_SESSION environment variable
-        desktop_session = os.environ.get('DESKTOP_SESSION', '').lower()
-        if desktop_session in ['hyprland', 'labwc', 'sway', 'i3', 'openbox', 'fluxbox']:
+        desktop_session = env.get('DESKTOP_SESSION', '').lower()
+        if desktop_session in WM_CANDIDATES:
             return desktop_session
         
         # Check XDG_CURRENT_DESKTOP environment variable
-        xdg_desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
-        if 'hyprland' in xdg_desktop:
-            return 'hyprland'
-        elif 'labwc' in xdg_desktop:
-            return 'labwc'
-        elif 'sway' in xdg_desktop:
-            return 'sway'
-        elif 'i3' in xdg_desktop:
-            return 'i3'
-        elif 'openbox' in xdg_desktop:
-            return 'openbox'
-        elif 'fluxbox' in xdg_desktop:
-            return 'fluxbox'
+        match = _WM_RE.search(env.get('XDG_CURRENT_DESKTOP', ''))
+        if match:
+            return match.group(0).lower()
             
-        # Try to detect via ps
-        try:
-            result = subprocess.run(['ps', '-e'], capture_output=True, text=True)
-            for line in result.stdout.split('\n'):
-                if 'hyprland' in line.lower():
-                    return 'hyprland'
-                elif 'labwc' in line.lower():
-                    return 'labwc'
-                elif 'sway' in line.lower():
-                    return 'sway'
-                elif 'i3' in line.lower():
-                    return 'i3'
-        except:
-            pass
+        # Try to detect via running processes
+        process_names = self._get_process_names()
+        for wm in WM_PROCESS_NAMES:
+            if wm in process_names:
+                return wm
             
         return None
     
@@ -259,37 +457,65 @@ class DotfileManager:
             return 'wayland'
         
         # Fallback to process detection
-        try:
-            result = subprocess.run(['ps', '-e'], capture_output=True, text=True)
-            for line in result.stdout.split('\n'):
-                if 'picom' in line.lower():
-                    return 'picom'
-                elif 'compton' in line.lower():
-                    return 'compton'
-                elif 'xcompmgr' in line.lower():
-                    return 'xcompmgr'
-        except:
-            pass
+        process_names = self._get_process_names()
+        for compositor in COMPOSITOR_PROCESS_NAMES:
+            if compositor in process_names:
+                return compositor
             
         return None
     
+    def _get_process_names(self) -> set:
+        """Get the lowercase names of running processes, cached per instance"""
+        if self._proc_names is not None:
+            return self._proc_names
+        
+        names = set()
+        try:
+            # Read /proc/<pid>/comm directly instead of forking ps
+            with os.scandir('/proc') as it:
+                for entry in it:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        with open(f"/proc/{entry.name}/comm", 'r') as f:
+                            names.add(f.read().strip().lower())
+                    except OSError:
+                        continue
+        except OSError:
+            # No /proc (e.g. macOS), fall back to ps
+            try:
+                result = subprocess.run(['ps', '-e', '-o', 'comm='], capture_output=True, text=True)
+                for line in result.stdout.split('\n'):
+                    if line.strip():
+                        names.add(os.path.basename(line.strip()).lower())
+            except:
+                pass
+        
+        self._proc_names = names
+        return names
+    
     def find_widget_configs(self, widget_name: str) -> List[Path]:
         """Find all configuration directories for a widget"""
         widget_path = self.repo_path / widget_name
-        if not widget_path.exists():
-            logger.warning(f"Widget '{widget_name}' not found in {self.repo_path}")
-            return []
-        
         configs = []
+        default_path = None
         
-        # Look for environment-specific configs
-        for item in widget_path.iterdir():
-            if item.is_dir() and item.name != 'default':
-                configs.append(item)
+        # Look for environment-specific configs, noting the default config in the same pass
+        try:
+            with os.scandir(widget_path) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    if entry.name == 'default':
+                        default_path = Path(entry.path)
+                    else:
+                        configs.append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning(f"Widget '{widget_name}' not found in {self.repo_path}")
+            return []
         
-        # Add default config if it exists
-        default_path = widget_path / 'default'
-        if default_path.exists():
+        # Add default config last if it exists
+        if default_path:
             configs.append(default_path)
             
         return configs
@@ -304,6 +530,9 @@ class DotfileManager:
         best_config = None
         best_score = 0
         
+        # Normalize environment values once rather than per config
+        env_pairs = [(value.lower(), value.lower().split()) for value in environment.values() if value]
+        
         for config_path in configs:
             if config_path.name == 'default':
                 continue
@@ -311,14 +540,11 @@ class DotfileManager:
             score = 0
             config_name = config_path.name.lower()
             
-            # Check for exact matches
-            for env_type, env_value in environment.items():
-                if env_value and env_value.lower() in config_name:
+            # Exact matches score 2, partial (word) matches score 1
+            for full, parts in env_pairs:
+                if full in config_name:
                     score += 2
-            
-            # Check for partial matches
-            for env_type, env_value in environment.items():
-                if env_value and any(part in config_name for part in env_value.lower().split()):
+                if any(part in config_name for part in parts):
                     score += 1
             
             if score > best_score:
@@ -335,19 +561,47 @@ class DotfileManager:
     
     def get_config_files(self, config_path: Path) -> List[Tuple[Path, str]]:
         """Get all config files from a configuration directory"""
+        # Share one directory walk between install_widget and check_program_compatibility
+        key = str(config_path)
+        if key not in self._config_files_cache:
+            self._config_files_cache[key] = self._scan_config_files(config_path)
+        return list(self._config_files_cache[key])
+    
+    def _scan_config_files(self, config_path: Path) -> List[Tuple[Path, str]]:
+        """Walk a configuration directory and map each file to its target directory"""
         files = []
         
-        for item in config_path.rglob('*'):
-            if item.is_file() and not item.name.startswith('.'):
+        # Check for custom mappings first
+        widget_name = config_path.parent.name
+        custom_mappings = self.config.get('custom_mappings', {}).get(widget_name, {})
+        
+        # Walk with os.scandir so file/dir checks use the cached dirent type
+        # instead of a stat per entry, skipping dotfiles before descending
+        root = str(config_path)
+        prefix_len = len(root) + len(os.sep)
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                
                 # Determine target directory based on file location
-                relative_path = item.relative_to(config_path)
+                relative_parts = entry.path[prefix_len:].split(os.sep)
                 
                 # Check if it's in a specific program directory
-                if len(relative_path.parts) > 1:
-                    program_name = relative_path.parts[0]
-                    # Check for custom mappings first
-                    widget_name = config_path.parent.name
-                    custom_mappings = self.config.get('custom_mappings', {}).get(widget_name, {})
+                if len(relative_parts) > 1:
+                    program_name = relative_parts[0]
                     if program_name in custom_mappings:
                         target_dir = self.home_config / custom_mappings[program_name]
                     else:
@@ -355,10 +609,10 @@ class DotfileManager:
                         target_dir = self.home_config / program_name
                 else:
                     # Use filename as the target directory
-                    program_name = item.stem
+                    program_name = Path(entry.name).stem
                     target_dir = self.home_config / program_name
                 
-                files.append((item, str(target_dir)))
+                files.append((Path(entry.path), str(target_dir)))
         
         return files
     
@@ -369,6 +623,13 @@ class DotfileManager:
             'multiple_config_info': []
         }
         
+        single_config_programs = self.program_compatibility.get('single_config_only', {})
+        multiple_config_programs = self.program_compatibility.get('supports_multiple_configs', {})
+        
+        # Nothing can be reported without any compatibility entries
+        if not single_config_programs and not multiple_config_programs:
+            return warnings
+        
         # Group files by program
         program_files = {}
         for source_path, target_dir in config_files:
@@ -377,27 +638,26 @@ class DotfileManager:
                 program_files[program_name] = []
             program_files[program_name].append((source_path, target_dir))
         
-        # If widget_name is provided, check across all environments for that widget
-        if widget_name:
+        # If widget_name is provided, check across all environments for that widget,
+        # but only when a program being installed has a compatibility entry
+        known_programs = single_config_programs.keys() | multiple_config_programs.keys()
+        if widget_name and not known_programs.isdisjoint(program_files):
             all_configs = self.find_widget_configs(widget_name)
-            all_program_files = {}
-            
-            for config_path in all_configs:
-                all_files = self.get_config_files(config_path)
-                for source_path, target_dir in all_files:
-                    program_name = Path(target_dir).name
-                    if program_name not in all_program_files:
-                        all_program_files[program_name] = []
-                    all_program_files[program_name].append((source_path, target_dir))
             
-            # Use the comprehensive list if we have multiple environments
+            # Only walk every environment if the comprehensive list will be used
             if len(all_configs) > 1:
+                all_program_files = {}
+                for config_path in all_configs:
+                    all_files = self.get_config_files(config_path)
+                    for source_path, target_dir in all_files:
+                        program_name = Path(target_dir).name
+                        if program_name not in all_program_files:
+                            all_program_files[program_name] = []
+                        all_program_files[program_name].append((source_path, target_dir))
+                
                 program_files = all_program_files
         
         # Check each program for compatibility issues
-        single_config_programs = self.program_compatibility.get('single_config_only', {})
-        multiple_config_programs = self.program_compatibility.get('supports_multiple_configs', {})
-        
         for program_name, files in program_files.items():
             if len(files) > 1:  # Multiple configs for the same program
                 if program_name in single_config_programs:
@@ -437,21 +697,31 @@ class DotfileManager:
         if self.config.get('create_backup_dir', True):
             backup_dir.mkdir(exist_ok=True)
         
-        backup_path = backup_dir / target_path.name
+        # Snapshot the backup directory once and pick free names in memory
+        if self._backup_existing_names is None:
+            try:
+                self._backup_existing_names = set(os.listdir(backup_dir))
+            except OSError:
+                self._backup_existing_names = set()
+        names = self._backup_existing_names
+        
+        backup_name = target_path.name
         counter = 1
-        while backup_path.exists():
-            backup_path = backup_dir / f"{target_path.name}.{counter}"
+        while backup_name in names:
+            backup_name = f"{target_path.name}.{counter}"
             counter += 1
+        backup_path = backup_dir / backup_name
         
         try:
             shutil.copy2(target_path, backup_path)
+            names.add(backup_name)
             logger.info(f"Backed up {target_path} to {backup_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to backup {target_path}: {e}")
             return False
     
-    def install_config(self, source_path: Path, target_dir: str) -> bool:
+    def install_config(self, source_path: Path, target_dir: str, create_dirs: bool = True) -> bool:
         """Install a configuration file"""
         target_path = Path(target_dir) / source_path.name
         
@@ -459,8 +729,9 @@ class DotfileManager:
             logger.info(f"[DRY RUN] Would copy {source_path} to {target_path}")
             return True
         
-        # Create target directory
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create target directory (callers installing in bulk create them up front)
+        if create_dirs:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Backup existing file
         if not self.backup_existing(target_path):
@@ -501,22 +772,9 @@ class DotfileManager:
             env_folder.mkdir(parents=True, exist_ok=True)
             
             # Get configuration from external file
-            include_programs = self.auto_config_rules.get('include_programs', {})
-            exclude_directories = self.auto_config_rules.get('exclude_directories', {})
-            include_keywords = self.auto_config_rules.get('include_keywords', [])
             confirmation_threshold = self.auto_config_rules.get('confirmation_threshold', 10)
             max_configs = self.auto_config_rules.get('max_configs_per_pull', 50)
             
-            # Flatten include programs into a single set
-            common_dotfile_programs = set()
-            for category, programs in include_programs.items():
-                common_dotfile_programs.update(programs)
-            
-            # Flatten exclude directories into a single set
-            exclude_dirs = set()
-            for category, directories in exclude_directories.items():
-                exclude_dirs.update(directories)
-            
             # Get list of config directories
             if specific_programs:
                 # Only pull specified programs
@@ -528,13 +786,17 @@ class DotfileManager:
             else:
                 # Pull common dotfile programs, excluding system directories
                 config_dirs = []
-                for item in self.home_config.iterdir():
-                    if (item.is_dir() and 
-                        not item.name.startswith('.') and
-                        item.name not in exclude_dirs and
-                        (item.name in common_dotfile_programs or 
-                         any(keyword in item.name.lower() for keyword in include_keywords))):
-                        config_dirs.append(item)
+                # Cheapest checks first; the dirent type avoids a stat for the dir check
+                with os.scandir(self.home_config) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith('.') or name in self._exclude_dirs_set:
+                            continue
+                        if (name not in self._include_programs_set and
+                            not any(keyword in name.lower() for keyword in self._include_keywords_lower)):
+                            continue
+                        if entry.is_dir():
+                            config_dirs.append(Path(entry.path))
             
             if not config_dirs:
                 print(f"No suitable configurations found in {self.home_config}")
@@ -557,26 +819,25 @@ class DotfileManager:
                     print("Operation cancelled.")
                     return False
             
+            copy_plan = []
             for config_dir in config_dirs:
                 target_dir = env_folder / config_dir.name
                 print(f"  - {config_dir.name} -> {target_dir}")
-                
-                # Copy the config directory with better filtering
-                if target_dir.exists():
-                    import shutil
-                    shutil.rmtree(target_dir)
-                
-                import shutil
-                try:
-                    # Use ignore patterns from external configuration
-                    ignore_patterns_list = self.auto_config_rules.get('ignore_patterns', [
-                        '*.lock', '*.socket', '*.cookie', '*.pid', '*.tmp', '*.log', '*.cache'
-                    ])
-                    ignore_patterns = shutil.ignore_patterns(*ignore_patterns_list)
-                    shutil.copytree(config_dir, target_dir, ignore=ignore_patterns)
-                except (OSError, IOError) as e:
-                    print(f"    Warning: Could not copy {config_dir.name}: {e}")
-                    continue
+                copy_plan.append((config_dir, target_dir))
+            
+            # The copies touch independent subtrees and are I/O bound, so overlap them
+            with ThreadPoolExecutor(max_workers=min(8, len(copy_plan))) as executor:
+                futures = [executor.submit(self._copy_config_dir, config_dir, target_dir)
+                           for config_dir, target_dir in copy_plan]
+                # Report in the original order once all copies have finished
+                for (config_dir, _), future in zip(copy_plan, futures):
+                    error = future.result()
+                    if error:
+                        print(f"    Warning: Could not copy {config_dir.name}: {error}")
+            
+            # The repository contents changed, drop any cached directory walks
+            self._config_files_cache.clear()
+            self._widget_names_cache.clear()
             
             print(f"Successfully pulled {len(config_dirs)} configurations to {env_folder}")
             return True
@@ -585,6 +846,19 @@ class DotfileManager:
             print(f"Error pulling configurations: {e}")
             return False
 
+    def _copy_config_dir(self, config_dir: Path, target_dir: Path) -> Optional[OSError]:
+        """Replace target_dir with a filtered copy of config_dir, returning the copy error if any"""
+        # Copy the config directory with better filtering
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+        
+        try:
+            # Use ignore patterns from external configuration
+            shutil.copytree(config_dir, target_dir, ignore=self._ignore_patterns_fn)
+        except (OSError, IOError) as e:
+            return e
+        return None
+
     def install_widget(self, widget_name: str, environment: Optional[Dict[str, str]] = None, use_config_fallback: bool = False) -> bool:
         """Install configuration for a specific widget"""
         if environment is None:
@@ -622,9 +896,14 @@ class DotfileManager:
                 logger.info(info)
             print()  # Add blank line for readability
         
+        # Create each target directory once rather than once per file
+        if not self.config.get('dry_run', False):
+            for target_dir in {target_dir for _, target_dir in config_files}:
+                Path(target_dir).mkdir(parents=True, exist_ok=True)
+        
         success = True
         for source_path, target_dir in config_files:
-            if not self.install_config(source_path, target_dir):
+            if not self.install_config(source_path, target_dir, create_dirs=False):
                 success = False
         
         return success
@@ -634,7 +913,7 @@ class DotfileManager:
         if environment is None:
             environment = self.detect_environment()
         
-        widgets = [d.name for d in self.repo_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
+        widgets = self._list_widget_names()
         
         if not widgets:
             logger.warning("No widgets found in repository")
@@ -651,8 +930,18 @@ class DotfileManager:
     
     def list_widgets(self) -> List[str]:
         """List all available widgets"""
-        widgets = [d.name for d in self.repo_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
-        return sorted(widgets)
+        return self._list_widget_names()
+    
+    def _list_widget_names(self) -> List[str]:
+        """Get the sorted widget directory names of the current repo path, cached per path"""
+        key = str(self.repo_path)
+        if key not in self._widget_names_cache:
+            with os.scandir(self.repo_path) as it:
+                self._widget_names_cache[key] = sorted(
+                    entry.name for entry in it
+                    if not entry.name.startswith('.') and entry.is_dir()
+                )
+        return list(self._widget_names_cache[key])
     
     def show_widget_info(self, widget_name: str) -> None:
         """Show information about a widget"""
@@ -672,41 +961,79 @@ class DotfileManager:
     
     def load_repo_list(self) -> List[Dict[str, str]]:
         """Load the list of compatible repositories"""
-        repos = []
-        if self.repo_list_file.exists():
-            try:
-                with open(self.repo_list_file, 'r') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            # Parse format: name|url|description|tags
-                            parts = line.split('|')
-                            if len(parts) >= 2:
-                                repo_info = {
-                                    'name': parts[0].strip(),
-                                    'url': parts[1].strip(),
-                                    'description': parts[2].strip() if len(parts) > 2 else '',
-                                    'tags': parts[3].strip().split(',') if len(parts) > 3 else [],
-                                    'line_number': line_num
-                                }
-                                repos.append(repo_info)
-                            else:
-                                logger.warning(f"Invalid format in repo list line {line_num}: {line}")
-            except Exception as e:
-                logger.error(f"Error reading repo list: {e}")
-        return repos
+        # Callers get their own copy, tags included, so edits can't leak into the cache
+        return [{**repo, 'tags': list(repo['tags'])} for repo in self._load_repo_cache()[0]]
+    
+    def _load_repo_cache(self) -> Tuple[List[Dict[str, str]], Dict[str, Dict[str, Dict[str, str]]]]:
+        """Return the parsed repo list and its name/URL index, reparsing only when the file changed"""
+        try:
+            stat = self.repo_list_file.stat()
+        except OSError:
+            return [], self._index_repos([])
+        
+        # Reuse the parsed list and index while the file is unchanged
+        cache_key = (str(self.repo_list_file), stat.st_mtime_ns, stat.st_size)
+        if self._repo_list_cache is not None and self._repo_list_cache[0] == cache_key:
+            return self._repo_list_cache[1], self._repo_list_cache[2]
+        
+        try:
+            # Split fields with the C csv reader; no quoting so values are taken verbatim
+            with open(self.repo_list_file, 'r', newline='') as f:
+                reader = csv.reader(f, delimiter='|', quoting=csv.QUOTE_NONE)
+                parsed = [self._parse_repo_row(row, reader.line_num)
+                          for row in reader
+                          if any(field.strip() for field in row)
+                          and not row[0].lstrip().startswith('#')]
+            repos = [repo_info for repo_info in parsed if repo_info is not None]
+        except Exception as e:
+            logger.error(f"Error reading repo list: {e}")
+            return [], self._index_repos([])
+        
+        index = self._index_repos(repos)
+        self._repo_list_cache = (cache_key, repos, index)
+        return repos, index
+    
+    def _index_repos(self, repos: List[Dict[str, str]]) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """Index repositories by name and by URL, keeping the first entry for duplicates"""
+        index = {'by_name': {}, 'by_url': {}}
+        for repo in repos:
+            index['by_name'].setdefault(repo['name'], repo)
+            index['by_url'].setdefault(repo['url'], repo)
+        return index
+    
+    def _find_repo(self, name: str) -> Optional[Dict[str, str]]:
+        """Look up a repository by name in the cached index, returning a copy"""
+        repo = self._load_repo_cache()[1]['by_name'].get(name)
+        return {**repo, 'tags': list(repo['tags'])} if repo else None
+    
+    def _parse_repo_row(self, parts: List[str], line_num: int) -> Optional[Dict[str, str]]:
+        """Parse the name|url|description|tags fields of a repo list line"""
+        if len(parts) < 2:
+            logger.warning(f"Invalid format in repo list line {line_num}: {'|'.join(parts).strip()}")
+            return None
+        return {
+            'name': parts[0].strip(),
+            'url': parts[1].strip(),
+            'description': parts[2].strip() if len(parts) > 2 else '',
+            'tags': parts[3].strip().split(',') if len(parts) > 3 else [],
+            'line_number': line_num
+        }
     
     def save_repo_list(self, repos: List[Dict[str, str]]) -> bool:
         """Save the list of compatible repositories"""
         try:
-            with open(self.repo_list_file, 'w') as f:
-                f.write("# Compatible Dotfile Repositories\n")
-                f.write("# Format: name|url|description|tags (comma-separated)\n")
-                f.write("# Example: my-theme|https://github.com/user/my-theme.git|A beautiful theme|hyprland,eww\n\n")
-                
-                for repo in repos:
-                    tags_str = ','.join(repo.get('tags', []))
-                    f.write(f"{repo['name']}|{repo['url']}|{repo.get('description', '')}|{tags_str}\n")
+            parts = [
+                "# Compatible Dotfile Repositories\n",
+                "# Format: name|url|description|tags (comma-separated)\n",
+                "# Example: my-theme|https://github.com/user/my-theme.git|A beautiful theme|hyprland,eww\n\n"
+            ]
+            parts.extend(f"{repo['name']}|{repo['url']}|{repo.get('description', '')}|{','.join(repo.get('tags', []))}\n"
+                         for repo in repos)
+            
+            # Write in one go to a temp file and swap it in, so an interrupted save can't truncate the list
+            with _atomic_write(self.repo_list_file) as f:
+                f.write(''.join(parts))
+            self._repo_list_cache = None
             return True
         except Exception as e:
             logger.error(f"Error saving repo list: {e}")
@@ -714,33 +1041,7 @@ class DotfileManager:
     
     def extract_repo_name_from_url(self, url: str) -> str:
         """Extract repository name from URL"""
-        try:
-            # Parse the URL
-            parsed = urllib.parse.urlparse(url)
-            
-            # Handle different URL formats
-            if parsed.netloc in ['github.com', 'gitlab.com', 'bitbucket.org']:
-                # Extract path and remove .git suffix
-                path = parsed.path.strip('/')
-                if path.endswith('.git'):
-                    path = path[:-4]
-                
-                # Split by '/' and take the last part (repo name)
-                repo_name = path.split('/')[-1]
-                return repo_name
-            
-            # For other URLs, try to extract from path
-            path = parsed.path.strip('/')
-            if path.endswith('.git'):
-                path = path[:-4]
-            
-            # Take the last part of the path
-            repo_name = path.split('/')[-1] if path else "unknown-repo"
-            return repo_name
-            
-        except Exception as e:
-            logger.warning(f"Could not extract repo name from URL {url}: {e}")
-            return "unknown-repo"
+        return _extract_repo_name(url)
     
     def add_repo(self, url: str, description: str = "", tags: List[str] = None, name: str = None, fetch_metadata: bool = True) -> bool:
         """Add a repository to the compatible list"""
@@ -751,13 +1052,11 @@ class DotfileManager:
         if name is None:
             name = self.extract_repo_name_from_url(url)
         
-        repos = self.load_repo_list()
-        
         # Check if repo already exists
-        for repo in repos:
-            if repo['name'] == name or repo['url'] == url:
-                logger.warning(f"Repository already exists: {name}")
-                return False
+        index = self._load_repo_cache()[1]
+        if name in index['by_name'] or url in index['by_url']:
+            logger.warning(f"Repository already exists: {name}")
+            return False
         
         # Try to fetch metadata from the repository if requested
         if fetch_metadata and not description and not tags:
@@ -776,20 +1075,9 @@ class DotfileManager:
                     else:
                         raise FileNotFoundError(f"Local path does not exist: {local_path}")
                 else:
-                    # Clone the repository temporarily to read metadata
-                    temp_path = self.git_repos_dir / f"temp_{name}"
-                    if temp_path.exists():
-                        shutil.rmtree(temp_path)
-                    
-                    # Clone to temp location
-                    subprocess.run(['git', 'clone', url, str(temp_path)], 
-                                 check=True, capture_output=True, text=True)
-                    
-                    # Read metadata
-                    metadata = self.read_repo_metadata(temp_path)
-                    
-                    # Clean up temp directory
-                    shutil.rmtree(temp_path)
+                    # Clone (or refresh the cached clone of) the repository to read metadata
+                    cache_path = self._get_cached_clone(url)
+                    metadata = self.read_repo_metadata(cache_path)
                 
                 # Use metadata if available
                 if metadata.get('description'):
@@ -809,9 +1097,57 @@ class DotfileManager:
             'tags': tags
         }
         
+        repos = self.load_repo_list()
         repos.append(new_repo)
         return self.save_repo_list(repos)
     
+    def _get_cached_clone(self, url: str) -> Path:
+        """Get an up to date shallow clone of url from the clone cache"""
+        cache_dir = self.git_repos_dir / ".cache"
+        self._prune_clone_cache(cache_dir)
+        
+        key = hashlib.sha256(f"{url}|HEAD".encode()).hexdigest()[:16]
+        cache_path = cache_dir / key
+        
+        if (cache_path / ".git").exists():
+            # Reuse the cached clone, only fetching the latest commit
+            subprocess.run(['git', '-C', str(cache_path), 'fetch', '--quiet', '--depth=1', '--no-tags', 'origin', 'HEAD'],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            subprocess.run(['git', '-C', str(cache_path), 'reset', '--quiet', '--hard', 'FETCH_HEAD'],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        else:
+            # Remove leftovers of an interrupted clone
+            if cache_path.exists():
+                shutil.rmtree(cache_path)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Metadata-only clone: no history, no tags, and only the metadata files checked out
+            subprocess.run(['git', 'clone', '--quiet', '--depth=1', '--filter=blob:none', '--sparse', '--no-tags',
+                          url, str(cache_path)],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            subprocess.run(['git', '-C', str(cache_path), 'sparse-checkout', 'set', '--no-cone',
+                          *(f"/{filename}" for filename in METADATA_FILES)],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        
+        # Mark the entry as recently used for TTL pruning
+        os.utime(cache_path)
+        return cache_path
+    
+    def _prune_clone_cache(self, cache_dir: Path) -> None:
+        """Remove cached clones that have not been used within CLONE_CACHE_TTL"""
+        try:
+            entries = list(os.scandir(cache_dir))
+        except FileNotFoundError:
+            return
+        
+        cutoff = time.time() - CLONE_CACHE_TTL
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    logger.info(f"Removing stale cached clone: {entry.path}")
+                    shutil.rmtree(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not remove cached clone {entry.path}: {e}")
+    
     def add_repo_from_url(self, url: str, description: str = "", tags: List[str] = None) -> Tuple[bool, str]:
         """Add a repository from URL with automatic name extraction"""
         extracted_name = self.extract_repo_name_from_url(url)
@@ -841,49 +1177,71 @@ class DotfileManager:
             'source': 'file'
         }
         
-        # Try different metadata file formats
-        metadata_files = [
-            'dotfile-info.json',
-            'dotfile-info.yaml',
-            'dotfile-info.yml',
-            '.dotfile-info.json',
-            'README.md'
-        ]
+        # List the repository once instead of probing each candidate file
+        try:
+            repo_entries = set(os.listdir(repo_path))
+        except OSError:
+            repo_entries = set()
         
-        for filename in metadata_files:
+        # Try different metadata file formats; the first one read successfully wins
+        for filename in METADATA_FILES:
             file_path = repo_path / filename
-            if file_path.exists():
+            if filename in repo_entries:
                 try:
                     if filename.endswith('.json'):
-                        with open(file_path, 'r') as f:
-                            data = json.load(f)
-                            metadata.update(data)
+                        if ijson is not None:
+                            # Stream top-level keys and stop once every wanted field is seen;
+                            # merge only after parsing succeeds so a bad file leaves no partial fields
+                            found = {}
+                            with open(file_path, 'rb') as f:
+                                # kvitems yields nothing for a non-object document; reject it like the json path does
+                                _, first_event, _ = next(ijson.parse(f), ('', None, None))
+                                if first_event != 'start_map':
+                                    raise ValueError("top-level JSON value is not an object")
+                                f.seek(0)
+                                for key, value in ijson.kvitems(f, '', use_float=True):
+                                    if key in _METADATA_FIELDS:
+                                        found[key] = value
+                                        if len(found) == len(_METADATA_FIELDS):
+                                            break
+                            metadata.update(found)
                             break
+                        with open(file_path, 'rb') as f:
+                            data = _json_loads(f.read())
+                        # Only take the metadata fields, matching the streaming path
+                        metadata.update({key: value for key, value in data.items() if key in _METADATA_FIELDS})
+                        break
                     elif filename.endswith(('.yaml', '.yml')):
-                        # Try to import yaml, fall back to basic parsing if not available
-                        try:
-                            import yaml
-                            with open(file_path, 'r') as f:
-                                data = yaml.safe_load(f)
-                                metadata.update(data)
-                                break
-                        except ImportError:
+                        # Skip YAML files if PyYAML is not available
+                        yaml = _get_yaml()
+                        if yaml is None:
                             logger.warning("PyYAML not available, skipping YAML metadata files")
+                            continue
+                        # Use the libyaml-backed loader when PyYAML was built with it
+                        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                        with open(file_path, 'r') as f:
+                            data = yaml.load(f, Loader=loader)
+                        metadata.update({key: value for key, value in data.items() if key in _METADATA_FIELDS})
+                        break
                     elif filename == 'README.md':
                         # Extract basic info from README
-                        with open(file_path, 'r') as f:
-                            content = f.read()
-                            # Look for common patterns
-                            lines = content.split('\n')
-                            for line in lines[:10]:  # Check first 10 lines
-                                if line.startswith('# '):
-                                    metadata['description'] = line[2:].strip()
-                                    break
-                            # Look for tags in markdown
-                            import re
-                            tag_matches = re.findall(r'#(\w+)', content)
+                        # Map the README instead of reading it into a string; empty files can't be mapped
+                        if file_path.stat().st_size == 0:
+                            continue
+                        with open(file_path, 'rb') as f, \
+                                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                            # Look for a title near the top of the README
+                            header_match = _README_HEADER_RE.search(content, 0, README_HEADER_SCAN_BYTES)
+                            if header_match:
+                                metadata['description'] = header_match.group(1).decode('utf-8', 'replace').strip()
+                            # Look for tags in markdown without copying the whole file out of the mapping
+                            tag_matches = set()
+                            for raw_tag in _README_TAG_RE.findall(content):
+                                word = _README_TAG_WORD_RE.match(raw_tag.decode('utf-8', 'replace'))
+                                if word:
+                                    tag_matches.add(word.group())
                             if tag_matches:
-                                metadata['tags'] = list(set(tag_matches))
+                                metadata['tags'] = list(tag_matches)
                 except Exception as e:
                     logger.warning(f"Could not read metadata from {filename}: {e}")
                     continue
@@ -904,12 +1262,14 @@ class DotfileManager:
                 logger.info(f"Updating repository: {repo_name}")
                 try:
                     # Update existing repository
-                    subprocess.run(['git', 'pull'], cwd=local_path, check=True, 
-                                 capture_output=True, text=True)
+                    subprocess.run(['git', 'pull', '--quiet'], cwd=local_path, check=True, 
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                    self._config_files_cache.clear()
+                    self._widget_names_cache.clear()
                     logger.info(f"Successfully updated {repo_name}")
                     return True
                 except subprocess.CalledProcessError as e:
-                    logger.error(f"Failed to update {repo_name}: {e}")
+                    logger.error(f"Failed to update {repo_name}: {e} {e.stderr.strip()}")
                     return False
             else:
                 logger.info(f"Repository {repo_name} already exists. Use --force-update to update.")
@@ -917,12 +1277,13 @@ class DotfileManager:
         else:
             logger.info(f"Cloning repository: {repo_name}")
             try:
-                subprocess.run(['git', 'clone', repo_url, str(local_path)], 
-                             check=True, capture_output=True, text=True)
+                # Historical blobs are fetched lazily; the checkout itself is complete
+                subprocess.run(['git', 'clone', '--quiet', '--filter=blob:none', repo_url, str(local_path)], 
+                             check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 logger.info(f"Successfully cloned {repo_name}")
                 return True
             except subprocess.CalledProcessError as e:
-                logger.error(f"Failed to clone {repo_name}: {e}")
+                logger.error(f"Failed to clone {repo_name}: {e} {e.stderr.strip()}")
                 return False
     
     def check_repo_compatibility(self, repo_path: Path) -> Dict[str, any]:
@@ -939,23 +1300,21 @@ class DotfileManager:
             compatibility['issues'].append("Repository path does not exist")
             return compatibility
         
-        # Look for widget directories
-        for item in repo_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                widget_name = item.name
-                compatibility['widgets'].append(widget_name)
-                
-                # Check for environment-specific configs
-                for subitem in item.iterdir():
-                    if subitem.is_dir():
-                        if subitem.name == 'default':
-                            continue
-                        compatibility['environments'].add(subitem.name)
-                        
-                        # Check for program directories
-                        for prog_item in subitem.iterdir():
-                            if prog_item.is_dir():
-                                compatibility['programs'].add(prog_item.name)
+        # Look for widget directories (os.scandir entries carry the dirent type, avoiding a stat each)
+        with os.scandir(repo_path) as items:
+            widget_dirs = [item for item in items if not item.name.startswith('.') and item.is_dir()]
+        compatibility['widgets'] = [item.name for item in widget_dirs]
+        
+        # Very large repos: overlap the per-widget directory reads instead of issuing them one by one
+        if len(widget_dirs) > PARALLEL_SCAN_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self._scan_widget_layout, (item.path for item in widget_dirs)))
+        else:
+            results = [self._scan_widget_layout(item.path) for item in widget_dirs]
+        
+        for environments, programs in results:
+            compatibility['environments'].update(environments)
+            compatibility['programs'].update(programs)
         
         # Determine compatibility
         if compatibility['widgets']:
@@ -965,6 +1324,26 @@ class DotfileManager:
         
         return compatibility
     
+    def _scan_widget_layout(self, widget_dir: str) -> Tuple[set, set]:
+        """Collect the environment and program directory names of one widget"""
+        environments = set()
+        programs = set()
+        
+        # Check for environment-specific configs
+        with os.scandir(widget_dir) as subitems:
+            for subitem in subitems:
+                if subitem.name == 'default' or not subitem.is_dir():
+                    continue
+                environments.add(subitem.name)
+                
+                # Check for program directories
+                with os.scandir(subitem.path) as prog_items:
+                    for prog_item in prog_items:
+                        if prog_item.is_dir():
+                            programs.add(prog_item.name)
+        
+        return environments, programs
+    
     def list_available_repos(self, filter_tags: List[str] = None) -> List[Dict[str, str]]:
         """List available repositories, optionally filtered by tags"""
         repos = self.load_repo_list()
@@ -983,12 +1362,7 @@ class DotfileManager:
                             force_update: bool = False) -> bool:
         """Install configuration from a Git repository"""
         # Find the repository in our list
-        repos = self.load_repo_list()
-        repo_info = None
-        for repo in repos:
-            if repo['name'] == repo_name:
-                repo_info = repo
-                break
+        repo_info = self._find_repo(repo_name)
         
         if not repo_info:
             logger.error(f"Repository '{repo_name}' not found in compatible list")
@@ -998,6 +1372,11 @@ class DotfileManager:
         if not self.clone_repo(repo_info, force_update):
             return False
         
+        return self._install_from_cloned_repo(repo_name, widget_name, environment)
+    
+    def _install_from_cloned_repo(self, repo_name: str, widget_name: str = None,
+                                  environment: Optional[Dict[str, str]] = None) -> bool:
+        """Check and install widgets from a repository already cloned into git_repos_dir"""
         # Check compatibility
         repo_path = self.git_repos_dir / repo_name
         compatibility = self.check_repo_compatibility(repo_path)
@@ -1025,6 +1404,46 @@ class DotfileManager:
             success = self.install_all_widgets(environment)
             self.repo_path = original_repo_path
             return success
+    
+    def clone_repos_bulk(self, repo_infos: List[Dict[str, str]], force_update: bool = False,
+                         max_workers: int = 8) -> Dict[str, bool]:
+        """Clone or update several repositories concurrently, returning success per repo name"""
+        if not repo_infos:
+            return {}
+        
+        # Each repo is cloned into a directory named after it, so clone duplicates only once
+        unique_repos = {}
+        for repo_info in repo_infos:
+            unique_repos.setdefault(repo_info['name'], repo_info)
+        repo_infos = list(unique_repos.values())
+        
+        # Clones are network bound, so run them side by side
+        self.git_repos_dir.mkdir(exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_infos))) as executor:
+            futures = [executor.submit(self.clone_repo, repo_info, force_update) for repo_info in repo_infos]
+            return {repo_info['name']: future.result() for repo_info, future in zip(repo_infos, futures)}
+    
+    def install_all_from_git_repos(self, filter_tags: List[str] = None,
+                                   environment: Optional[Dict[str, str]] = None,
+                                   force_update: bool = False) -> bool:
+        """Install every repository from the compatible list, optionally filtered by tags"""
+        repos = self.list_available_repos(filter_tags)
+        if not repos:
+            logger.warning("No repositories found in compatible list")
+            return False
+        
+        # Fetch everything up front, then install from the local clones
+        clone_results = self.clone_repos_bulk(repos, force_update)
+        
+        success = True
+        for repo_name, cloned in clone_results.items():
+            if not cloned:
+                success = False
+                continue
+            if not self._install_from_cloned_repo(repo_name, None, environment):
+                success = False
+        
+        return success
 
 
 def main():
@@ -1045,6 +1464,8 @@ def main():
     parser.add_argument('--no-fetch-metadata', action='store_true', help='Do not fetch metadata from repository files')
     parser.add_argument('--remove-repo', help='Remove a repository from the compatible list')
     parser.add_argument('--install-from-git', help='Install from a Git repository')
+    parser.add_argument('--install-all-from-git', action='store_true',
+                       help='Install all Git repositories from the compatible list (use --filter-tags to limit)')
     parser.add_argument('--git-widget', help='Install specific widget from Git repository')
     parser.add_argument('--force-update', action='store_true', help='Force update Git repositories')
     parser.add_argument('--filter-tags', help='Filter repositories by tags (comma-separated)')
@@ -1080,7 +1501,7 @@ def main():
     environment = None
     if args.environment:
         try:
-            environment = json.loads(args.environment)
+            environment = _json_loads(args.environment)
         except json.JSONDecodeError:
             logger.error("Invalid JSON format for environment override")
             return 1
@@ -1222,11 +1643,11 @@ def main():
     if args.update_compatibility:
         # Update program compatibility file
         source = args.update_compatibility
+        raw = None
         if source.startswith(('http://', 'https://')):
             # Download from URL
             try:
-                import urllib.request
-                urllib.request.urlretrieve(source, str(manager.program_compatibility_file))
+                raw = _download_file(source, manager.program_compatibility_file)
                 print(f"Successfully updated program compatibility file from {source}")
             except Exception as e:
                 logger.error(f"Failed to download compatibility file: {e}")
@@ -1234,24 +1655,24 @@ def main():
         else:
             # Copy from local path
             try:
-                shutil.copy2(source, str(manager.program_compatibility_file))
+                raw = _copy_file(source, manager.program_compatibility_file)
                 print(f"Successfully updated program compatibility file from {source}")
             except Exception as e:
                 logger.error(f"Failed to copy compatibility file: {e}")
                 return 1
         
         # Reload the compatibility settings
-        manager.program_compatibility = manager._load_program_compatibility()
+        manager.program_compatibility = manager._load_program_compatibility(raw)
         return 0
     
     if args.update_auto_config_rules:
         # Update auto config rules file
         source = args.update_auto_config_rules
+        raw = None
         if source.startswith(('http://', 'https://')):
             # Download from URL
             try:
-                import urllib.request
-                urllib.request.urlretrieve(source, str(manager.auto_config_rules_file))
+                raw = _download_file(source, manager.auto_config_rules_file)
                 print(f"Successfully updated auto config rules file from {source}")
             except Exception as e:
                 logger.error(f"Failed to download auto config rules file: {e}")
@@ -1259,16 +1680,21 @@ def main():
         else:
             # Copy from local path
             try:
-                shutil.copy2(source, str(manager.auto_config_rules_file))
+                raw = _copy_file(source, manager.auto_config_rules_file)
                 print(f"Successfully updated auto config rules file from {source}")
             except Exception as e:
                 logger.error(f"Failed to copy auto config rules file: {e}")
                 return 1
         
         # Reload the auto config rules
-        manager.auto_config_rules = manager._load_auto_config_rules()
+        manager.auto_config_rules = manager._load_auto_config_rules(raw)
         return 0
     
+    if args.install_all_from_git:
+        filter_tags = args.filter_tags.split(',') if args.filter_tags else None
+        success = manager.install_all_from_git_repos(filter_tags, environment, args.force_update)
+        return 0 if success else 1
+    
     if args.install_from_git:
         if args.git_widget:
             success = manager.install_from_git_repo(args.install_from_git, args.git_widget, 